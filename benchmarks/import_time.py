@@ -0,0 +1,57 @@
+"""Benchmark for the import time of ``fractpy``.
+
+Every statement is run in a new interpreter, so that nothing is
+cached between the runs. Run from the root of the repository::
+
+    python benchmarks/import_time.py [number of runs]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SETUP = (
+    "from fractpy.models import NewtonFractal\nNewtonFractal('x**3 - 1').save({file!r})"
+)
+
+STATEMENTS = {
+    "python": "pass",
+    "import fractpy": "import fractpy",
+    "import fractpy.models": "import fractpy.models",
+    "import sympy": "import sympy",
+    "import matplotlib.pyplot": "import matplotlib.pyplot",
+    "NewtonFractal('x**3 - 1')": (
+        "from fractpy.models import NewtonFractal\nNewtonFractal('x**3 - 1')"
+    ),
+    "NewtonFractal.load(file)": (
+        "from fractpy.models import NewtonFractal\nNewtonFractal.load({file!r})"
+    ),
+}
+
+
+def run(statement, runs):
+    """Returns the best wall time of running the statement in a new
+    interpreter.
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(runs=5):
+    """Prints the import times."""
+    with tempfile.TemporaryDirectory() as folder:
+        file = os.path.join(folder, "model.npz")
+        subprocess.run([sys.executable, "-c", SETUP.format(file=file)], check=True)
+        for name, statement in STATEMENTS.items():
+            seconds = run(statement.format(file=file), runs)
+            print(f"{name:<30}{seconds * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
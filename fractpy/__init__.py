@@ -1,6 +1,18 @@
 """A library to generate fractals"""
 
-from .function import Function
-from . import models
+import importlib
 
+__all__ = ["Function", "models"]
 __version__ = "0.0.4"
+
+
+def __getattr__(name):
+    # ``sympy`` and ``matplotlib`` are slow to import, so the
+    # submodules are only imported when they are first used.
+    if name == "Function":
+        from .function import Function
+
+        return Function
+    if name == "models":
+        return importlib.import_module(".models", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,15 @@
 
 import numpy as np
 import sympy as sym
+from sympy.printing.lambdarepr import NumExprPrinter
 from sympy.parsing.sympy_parser import (
     parse_expr,
     standard_transformations,
     implicit_multiplication_application,
 )
 
+from fractpy.step import load_numexpr_step
+
 
 class Function:
     """A class for performing basic operations on
@@ -55,6 +58,8 @@ class Function:
         if len(expr.free_symbols) == 1:
             self._function = expr
             self._variable = list(expr.free_symbols)[0]
+            self._derivatives = {0: expr}
+            self._reciprocal_derivatives = {0: 1 / expr}
         else:
             raise TypeError(
                 func
@@ -76,15 +81,64 @@ it has {len(expr.free_symbols)} variables"
         """
         return np.array(list(sym.solveset(self.function, self.variable)), dtype=complex)
 
-    def differentiate(self):
+    def coefficients(self):
+        """Calculate coefficients of the function, if it is a
+        polynomial.
+
+        Returns
+        -------
+        list
+            Coefficients of the polynomial, starting from the
+            highest power.
+        """
+        if not self.function.is_polynomial(self.variable):
+            raise TypeError(f"{self.function} is not a polynomial")
+        coeffs = sym.Poly(self.function, self.variable).all_coeffs()
+        return np.array(coeffs, dtype=complex)
+
+    def differentiate(self, order=1):
         """Differentiates the function.
 
+        Derivatives are computed once and cached, so that the
+        different iteration steps can share them.
+
+        Parameters
+        ----------
+        order : int, optional
+            Order of the derivative (default is 1).
+
         Returns
         -------
         ``sympy`` expression
             Derivative of the function.
         """
-        return sym.diff(self.function, self.variable)
+        _check_order(order, 0)
+        if order not in self._derivatives:
+            self._derivatives[order] = sym.diff(
+                self.differentiate(order - 1), self.variable
+            )
+        return self._derivatives[order]
+
+    def _reciprocal_derivative(self, order):
+        """Differentiates 1/f(x), caching the derivatives like
+        ``differentiate()``.
+
+        Parameters
+        ----------
+        order : int
+            Order of the derivative.
+
+        Returns
+        -------
+        ``sympy`` expression
+            Derivative of the reciprocal of the function.
+        """
+        _check_order(order, 0)
+        if order not in self._reciprocal_derivatives:
+            self._reciprocal_derivatives[order] = sym.diff(
+                self._reciprocal_derivative(order - 1), self.variable
+            )
+        return self._reciprocal_derivatives[order]
 
     def _relative_difference(self):
         """Computes the expression required for generating Newton
@@ -98,11 +152,88 @@ it has {len(expr.free_symbols)} variables"
         """
         return self.function / self.differentiate()
 
-    def _make_python_function(self, function=None, variable=None):
+    def _halley_step(self):
+        """Computes the expression required for generating Halley
+        fractal i.e. 2f(x)f'(x)/(2f'(x)**2 - f(x)f''(x)).
+
+        Returns
+        -------
+        ``sympy`` expression
+            The sympy expression for the iteration of Halley's
+            method.
+        """
+        f, df, d2f = (self.differentiate(n) for n in range(3))
+        return 2 * f * df / (2 * df**2 - f * d2f)
+
+    def _schroder_step(self):
+        """Computes the expression required for generating Schröder
+        fractal i.e. f(x)f'(x)/(f'(x)**2 - f(x)f''(x)).
+
+        Returns
+        -------
+        ``sympy`` expression
+            The sympy expression for the iteration of Schröder's
+            method.
+        """
+        f, df, d2f = (self.differentiate(n) for n in range(3))
+        return f * df / (df**2 - f * d2f)
+
+    def _householder_step(self, order):
+        """Computes the expression required for generating Householder
+        fractal of given order i.e. -d(1/f)^(d-1)(x)/(1/f)^(d)(x).
+
+        Parameters
+        ----------
+        order : int
+            Order of the method (1 gives Newton's method and 2
+            gives Halley's method).
+
+        Returns
+        -------
+        ``sympy`` expression
+            The sympy expression for the iteration of Householder's
+            method.
+        """
+        _check_order(order, 1)
+        lower = self._reciprocal_derivative(order - 1)
+        upper = self._reciprocal_derivative(order)
+        return sym.cancel(sym.together(-order * lower / upper))
+
+    def _optimize(self, function, variable):
+        """Simplifies the expression before converting it to python
+        function. The common factors of the numerator and denominator
+        (like ``exp(x)`` in the Newton step of ``sin(x)*exp(x)``) are
+        cancelled, and rational functions are written in Horner form.
+
+        Parameters
+        ----------
+        function : ``sympy`` expression
+            The function which is to be simplified.
+        variable : :obj:`sympy.Symbol`
+            The variable in terms which the function is defined.
+
+        Returns
+        -------
+        ``sympy`` expression
+            The simplified expression.
+        """
+        try:
+            function = sym.cancel(sym.together(function))
+        except sym.PolynomialError:
+            return function
+        if function.is_rational_function(variable):
+            num, den = sym.fraction(function)
+            function = sym.horner(num, variable) / sym.horner(den, variable)
+        return function
+
+    def _make_python_function(self, function=None, variable=None, backend="numpy"):
         """Converts ``sympy`` expression to python functions.
         This makes it easy to calculate multiple values by passing
         numpy arrays.
 
+        The expression is simplified first and the common
+        subexpressions are evaluated only once per call.
+
         Parameters
         ----------
         function : ``sympy`` expression
@@ -111,6 +242,9 @@ it has {len(expr.free_symbols)} variables"
         variable : :obj:`sympy.Symbol`
             The variable in terms which the function is defined
             (default is the variable in the object).
+        backend : {'numpy', 'numexpr'}, optional
+            The module used for evaluating the function (default
+            is 'numpy'). 'numexpr' requires the ``numexpr`` package.
 
         Returns
         -------
@@ -121,12 +255,45 @@ it has {len(expr.free_symbols)} variables"
             function = self.function
         if variable is None:
             variable = self.variable
-        return sym.lambdify(variable, function)
+        function = self._optimize(function, variable)
+        if backend == "numpy":
+            return sym.lambdify(variable, function, modules="numpy", cse=True)
+        if backend == "numexpr":
+            terms, result = _numexpr_terms(function)
+            return load_numexpr_step(str(variable), terms, result)
+        raise ValueError(
+            f"backend must be either 'numpy' or 'numexpr', got '{backend}'"
+        )
+
+    def _numexpr_source(self, function):
+        """Converts ``sympy`` expression to the ``numexpr`` expressions
+        of its common subexpressions, so it can be evaluated with
+        ``numexpr`` without ``sympy``.
+
+        Parameters
+        ----------
+        function : ``sympy`` expression
+            The function which is to be converted.
+
+        Returns
+        -------
+        tuple
+            Pairs of the names and expressions of the common
+            subexpressions, and the expression of the function in
+            terms of them.
+        """
+        return _numexpr_terms(self._optimize(function, self.variable))
 
-    def _rd_python_function(self):
+    def _rd_python_function(self, backend="numpy"):
         """Returns the expression required for generating Newton
         fractal i.e. f(x)/f'(x) in the form of Python function.
 
+        Parameters
+        ----------
+        backend : {'numpy', 'numexpr'}, optional
+            The module used for evaluating the function (default
+            is 'numpy').
+
         Returns
         -------
         function
@@ -134,4 +301,22 @@ it has {len(expr.free_symbols)} variables"
             method.
         """
         rd = self._relative_difference()
-        return self._make_python_function(rd, self.variable)
+        return self._make_python_function(rd, self.variable, backend)
+
+
+def _check_order(order, minimum):
+    """Raises ``ValueError`` if the order of a derivative or method
+    is not an integer greater than or equal to ``minimum``.
+    """
+    if not isinstance(order, int) or order < minimum:
+        raise ValueError(f"order must be an integer >= {minimum}, got {order}")
+
+
+def _numexpr_terms(function):
+    """Splits ``sympy`` expression into its common subexpressions,
+    printed as ``numexpr`` expressions.
+    """
+    printer = NumExprPrinter()
+    replacements, (reduced,) = sym.cse(function)
+    terms = tuple((str(symbol), printer._print(expr)) for symbol, expr in replacements)
+    return terms, printer._print(reduced)
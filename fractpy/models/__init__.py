@@ -1 +1,3 @@
-from .newton import NewtonFractal
+from .newton import NewtonFractal, RelaxedNewtonFractal
+from .householder import HouseholderFractal, HalleyFractal
+from .schroder import SchroderFractal
@@ -0,0 +1,104 @@
+"""Classes for plotting Householder and Halley Fractals."""
+from fractpy.models.newton import NewtonFractal
+
+
+class HouseholderFractal(NewtonFractal):
+    """A class for plotting Householder Fractal for a given function.
+
+    Householder's methods are a family of root-finding methods
+    of order d + 1, where the step is computed from the derivatives
+    of 1/f(x). The first order method is the Newton's method and
+    the second order method is the Halley's method. Higher order
+    methods converge in fewer iterations.
+
+    Parameters
+    ----------
+    func : ``sympy`` expression
+        The function for which we want to plot fractal (single-
+        variable).
+    order : int, optional
+        Order of the method (default is 3).
+    prec_goal : float, optional
+        Tolerance for how small the iteration step be relative
+        to the point to break the loop for that point.
+    nmax : int, optional
+        Number of iterations to be run (default is 200).
+    backend : {'numpy', 'numexpr'}, optional
+        The module used for evaluating the iteration step (default
+        is 'numpy').
+
+    Attributes
+    ----------
+    function : :obj:`fractpy.Function`
+        The function for which the fractal is being generated.
+    roots_list : list
+        Roots of the function.
+    order : int
+        Order of the method.
+
+    Example
+    -------
+    >>> model = HouseholderFractal("x**3 - 1", order=3)
+    >>> p = model.plot(-2, 2, -2, 2, (200, 200))
+
+    See Also
+    --------
+    fractpy.models.HalleyFractal :
+        Householder Fractal of order 2.
+    """
+
+    _name = "Householder Fractal"
+    _parameters = ("order",)
+
+    def __init__(self, func, order=3, prec_goal=1.0e-11, nmax=200, backend="numpy"):
+        self._order = order
+        super().__init__(func, prec_goal, nmax, backend)
+
+    @property
+    def order(self):
+        return self._order
+
+    def _step_expression(self):
+        """Returns the step of Householder's method of given order."""
+        return self.function._householder_step(self.order)
+
+
+class HalleyFractal(NewtonFractal):
+    """A class for plotting Halley Fractal for a given function.
+
+    Halley's method is the second order Householder's method with
+    the step 2f(x)f'(x)/(2f'(x)**2 - f(x)f''(x)). It has cubic
+    convergence near the simple roots.
+
+    Parameters
+    ----------
+    func : ``sympy`` expression
+        The function for which we want to plot fractal (single-
+        variable).
+    prec_goal : float, optional
+        Tolerance for how small the iteration step be relative
+        to the point to break the loop for that point.
+    nmax : int, optional
+        Number of iterations to be run (default is 200).
+    backend : {'numpy', 'numexpr'}, optional
+        The module used for evaluating the iteration step (default
+        is 'numpy').
+
+    Attributes
+    ----------
+    function : :obj:`fractpy.Function`
+        The function for which the fractal is being generated.
+    roots_list : list
+        Roots of the function.
+
+    Example
+    -------
+    >>> model = HalleyFractal("x**3 - 1")
+    >>> p = model.plot(-2, 2, -2, 2, (200, 200))
+    """
+
+    _name = "Halley Fractal"
+
+    def _step_expression(self):
+        """Returns the step of Halley's method."""
+        return self.function._halley_step()
@@ -1,10 +1,16 @@
 """A class for plotting Newton Fractal."""
+import importlib
+import importlib.util
+import inspect
+import pickle
+import warnings
+
 import numpy as np
-import matplotlib.pyplot as plt
-import sympy as sym
 
-from fractpy.zoom import UpdatingRect
-from fractpy import Function
+from fractpy.step import load_numpy_step, load_numexpr_step
+
+# ``sympy`` and ``matplotlib`` are imported where they are needed, so
+# that precompiled models can be loaded and rendered without them.
 
 
 class NewtonFractal:
@@ -33,6 +39,9 @@ class NewtonFractal:
         Number of iterations to be run (default is 200).
         Minimum recommended value is 50, but for some functions
         may required over 500.
+    backend : {'numpy', 'numexpr'}, optional
+        The module used for evaluating the iteration step (default
+        is 'numpy'). 'numexpr' requires the ``numexpr`` package.
 
     Attributes
     ----------
@@ -61,7 +70,15 @@ class NewtonFractal:
         a function (like finding roots).
     """
 
-    def __init__(self, func, prec_goal=1.0e-11, nmax=200):
+    _name = "Newton Fractal"
+    # Distance from a root within which a point is matched to it:
+    _find_goal = 1.0e-10
+    # Arguments of the model (other than the function) which are
+    # stored in the precompiled model:
+    _parameters = ()
+
+    def __init__(self, func, prec_goal=1.0e-11, nmax=200, backend="numpy"):
+        self._backend = backend
         self.function = func
         self._precision_goal = prec_goal
         self.n = nmax  # Number of iterations
@@ -69,36 +86,231 @@ class NewtonFractal:
     def __repr__(self):
         return (
             f"### FractPy Model ###\n"
-            f"Type: Newton Fractal\n"
-            f"Function: {self.function}"
+            f"Type: {self._name}\n"
+            f"Function: {self._expression}"
         )
 
     @property
     def function(self):
+        if self._function is None:
+            # Precompiled models parse the function only when needed
+            from fractpy.function import Function
+
+            self._function = Function(self._expression)
         return self._function
 
     @function.setter
     def function(self, func):
+        import sympy as sym
+        from fractpy.function import Function
+
         self._function = Function(func)
+        self._expression = str(self._function)
+        self._title = f"{self._name} for $f({sym.latex(self._function.variable)}) = \
+{sym.latex(self._function.function)}$"
         self._roots_list = self._function.roots()
-        self._newton_step = self._function._rd_python_function()
+        self._iteration_step = self._function._make_python_function(
+            self._step_expression(), backend=self._backend
+        )
+        self._step_source = None
+        self._numexpr_source = None
+        self._coefficients = None
+
+    def _step_expression(self):
+        """Returns the step subtracted from a point in each
+        iteration. Subclasses override this to use other methods.
+        """
+        return self.function._relative_difference()
 
     @property
     def roots_list(self):
         return self._roots_list
 
+    def to_dict(self):
+        """Returns the precompiled model i.e. the roots, the
+        coefficients (empty if the function is not a polynomial),
+        the source of the iteration step and the arguments of the
+        model. It
+        only contains strings and numbers, so the model can be
+        recreated without ``sympy`` using ``from_dict()``.
+
+        Returns
+        -------
+        dict
+            The precompiled model.
+        """
+        if self._step_source is None:
+            step = self._iteration_step
+            if self._backend != "numpy":
+                step = self.function._make_python_function(self._step_expression())
+            self._step_source = inspect.getsource(step)
+        if self._coefficients is None:
+            try:
+                self._coefficients = self.function.coefficients()
+            except TypeError:
+                self._coefficients = np.array([], dtype=complex)
+        data = {
+            "backend": self._backend,
+            "module": type(self).__module__,
+            "model": type(self).__qualname__,
+            "function": self._expression,
+            "title": self._title,
+            "roots": self.roots_list,
+            "coefficients": self._coefficients,
+            "step": self._step_source,
+            "prec_goal": self._precision_goal,
+            "nmax": self.n,
+        }
+        if self._backend == "numexpr":
+            if self._numexpr_source is None:
+                self._numexpr_source = self.function._numexpr_source(
+                    self._step_expression()
+                )
+            terms, result = self._numexpr_source
+            data["variable"] = str(self.function.variable)
+            data["numexpr_terms"] = list(terms)
+            data["numexpr_result"] = result
+        for parameter in self._parameters:
+            data[parameter] = getattr(self, parameter)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Creates the model from the precompiled model returned by
+        ``to_dict()``, without importing ``sympy``. Models using the
+        'numexpr' backend fall back to 'numpy' (with a warning) if
+        ``numexpr`` is not installed. As the source of the step is
+        executed, only load models from trusted sources.
+
+        Parameters
+        ----------
+        data : dict
+            The precompiled model.
+
+        Returns
+        -------
+        :obj:`fractpy.models.NewtonFractal`
+            The model (of the type it was saved as).
+        """
+        # Subclasses defined outside fractpy are imported from their module
+        model_class = importlib.import_module(data["module"])
+        for name in data["model"].split("."):
+            model_class = getattr(model_class, name, None)
+        if not isinstance(model_class, type) or not issubclass(model_class, cls):
+            raise TypeError(f"{data['model']} is not a {cls.__name__} model")
+
+        backend = data["backend"]
+        if backend == "numexpr" and importlib.util.find_spec("numexpr") is None:
+            warnings.warn(
+                "numexpr is not installed, the model is evaluated with numpy",
+                RuntimeWarning,
+            )
+            backend = "numpy"
+
+        model = model_class.__new__(model_class)
+        model._backend = backend
+        model._function = None
+        model._expression = data["function"]
+        model._title = data["title"]
+        model._roots_list = np.asarray(data["roots"], dtype=complex)
+        model._coefficients = np.asarray(data["coefficients"], dtype=complex)
+        model._step_source = data["step"]
+        model._numexpr_source = None
+        if "numexpr_terms" in data:
+            terms = tuple(
+                (str(name), str(expr)) for name, expr in data["numexpr_terms"]
+            )
+            model._numexpr_source = (terms, str(data["numexpr_result"]))
+        if backend == "numexpr":
+            model._iteration_step = load_numexpr_step(
+                str(data["variable"]), *model._numexpr_source
+            )
+        else:
+            model._iteration_step = load_numpy_step(data["step"])
+        model._precision_goal = data["prec_goal"]
+        model.n = data["nmax"]
+        for parameter in model_class._parameters:
+            setattr(model, "_" + parameter, data[parameter])
+        return model
+
+    def __reduce__(self):
+        # Pickle the precompiled model instead of the ``sympy`` objects
+        # and the generated function, so it can be sent to other
+        # processes.
+        return (type(self).from_dict, (self.to_dict(),))
+
+    def to_bytes(self):
+        """Returns the precompiled model as bytes, which can be sent
+        to other processes or machines and loaded with ``from_bytes()``.
+
+        Returns
+        -------
+        bytes
+            The precompiled model.
+        """
+        return pickle.dumps(self.to_dict(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Creates the model from the bytes returned by ``to_bytes()``,
+        without importing ``sympy``. Only load bytes from trusted
+        sources.
+
+        Parameters
+        ----------
+        data : bytes
+            The precompiled model.
+
+        Returns
+        -------
+        :obj:`fractpy.models.NewtonFractal`
+            The model (of the type it was saved as).
+        """
+        return cls.from_dict(pickle.loads(data))
+
+    def save(self, file):
+        """Saves the precompiled model to a ``.npz`` file, which can
+        be loaded with ``load()`` without importing ``sympy``.
+
+        Parameters
+        ----------
+        file : str or file
+            File name (``.npz`` is appended if missing) or file object.
+        """
+        np.savez(file, **self.to_dict())
+
+    @classmethod
+    def load(cls, file):
+        """Loads a model saved with ``save()``.
+
+        Parameters
+        ----------
+        file : str or file
+            File name or file object.
+
+        Returns
+        -------
+        :obj:`fractpy.models.NewtonFractal`
+            The model (of the type it was saved as).
+        """
+        with np.load(file) as arrays:
+            data = {
+                key: value.item() if value.ndim == 0 else value
+                for key, value in arrays.items()
+            }
+        return cls.from_dict(data)
+
     def _make_list(self):
         """Makes a list of all the points in the plane.
         Has to be called after assigning xvals and yvals.
         """
-        self._z_list = []
-        for a in self._xvals:
-            for b in self._yvals:
-                self._z_list.append(a + 1j * b)
+        self._z_list = np.add.outer(
+            np.asarray(self._xvals), 1j * np.asarray(self._yvals)
+        ).ravel()
 
     def _match_root(self):
         """Matches the point to the root to which it converges."""
-        findgoal = 1.0e-10 * np.ones(len(self._z_list))
+        findgoal = self._find_goal * np.ones(len(self._z_list))
         rootid = -1 * np.ones(len(self._z_list))
         for r in self.roots_list:
             # Check for closeness to each root in the list
@@ -109,29 +321,46 @@ class NewtonFractal:
             )
         return rootid
 
+    def _near_root(self, z):
+        """Checks which of the points are close enough to a root to
+        be matched to it by ``_match_root()``.
+        """
+        return (np.abs(z[:, np.newaxis] - self.roots_list) < self._find_goal).any(
+            axis=1
+        )
+
     def _prepare_plot(self, xstart, xend, ystart, yend):
         """Prepares the plot data for the given range."""
         self._xvals = np.linspace(xstart, xend, num=self._width)
         self._yvals = np.linspace(ystart, yend, num=self._height)
         self._make_list()
 
-        # Temporary array to be used for comparision:
-        temp_list = np.array(self._z_list)
-        # Relative difference of iteration step and the point:
-        rel_diff = np.ones(len(self._z_list))
+        z = self._z_list.astype(complex)
         # This counts number of iteration each point took to converge:
-        counter = np.zeros(len(self._z_list)).astype(int)
+        counter = np.zeros(len(z)).astype(int)
+        # Points which have not converged yet:
+        active = np.ones(len(z), dtype=bool)
         overall_counter = 0
-        prec_goal_list = np.ones(len(self._z_list)) * self._precision_goal
 
-        while any(rel_diff) > self._precision_goal and overall_counter < self.n:
-            newton_step = self._newton_step(temp_list)
-            self._z_list = temp_list - newton_step
-            rel_diff = np.abs(newton_step / temp_list)
-            temp_list = self._z_list
-            # If smaller then the tolerance then don't count:
-            counter = counter + np.greater(rel_diff, prec_goal_list)
-            overall_counter += 1
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            while active.any() and overall_counter < self.n:
+                temp_list = z[active]
+                step = self._iteration_step(temp_list)
+                new_list = temp_list - step
+                z[active] = new_list
+                # Relative difference of iteration step and the point:
+                rel_diff = np.abs(step / temp_list)
+                # If smaller then the tolerance then don't count:
+                moving = rel_diff > self._precision_goal
+                counter[active] += moving
+                # Stop iterating the points which have converged to a
+                # root (slowly converging points may take small steps
+                # while still far from it) or have diverged:
+                stopped = ~moving & self._near_root(new_list)
+                stopped |= ~np.isfinite(new_list)
+                active[active] = ~stopped
+                overall_counter += 1
+        self._z_list = z
 
         data = self._match_root().astype(int)
 
@@ -189,6 +418,8 @@ class NewtonFractal:
         -------
         :obj:`matplotlib.figure.Figure`
         """
+        import matplotlib.pyplot as plt
+
         self._width = dim[0]
         self._height = dim[1]
 
@@ -204,9 +435,7 @@ class NewtonFractal:
             ),
         )
         # fig.colorbar(ncmap, ax=ax)
-        title = f"Newton Fractal for $f({sym.latex(self.function.variable)}) = \
-{sym.latex(self.function.function)}$"
-        ax.set_title(title)
+        ax.set_title(self._title)
         plt.tight_layout()
 
         return fig
@@ -234,6 +463,9 @@ class NewtonFractal:
         -------
         :obj:`matplotlib.figure.Figure`
         """
+        import matplotlib.pyplot as plt
+        from fractpy.zoom import UpdatingRect
+
         self._width = dim[0]
         self._height = dim[1]
         Z = self._prepare_plot(xstart, xend, ystart, yend)
@@ -274,9 +506,70 @@ class NewtonFractal:
         ax2.callbacks.connect("ylim_changed", self._ax_update)
         ax2.set_title("Zoom here")
 
-        title = f"Newton Fractal for $f({sym.latex(self.function.variable)}) = \
-{sym.latex(self.function.function)}$"
-        fig.suptitle(title)
+        fig.suptitle(self._title)
         plt.tight_layout()
 
         return fig
+
+
+class RelaxedNewtonFractal(NewtonFractal):
+    """A class for plotting relaxed Newton Fractal for a given function.
+
+    The relaxed (or damped) Newton's method scales every step of the
+    Newton's method by a (possibly complex) factor ``a`` i.e.
+    z = z - a*f(z)/f'(z). Values of ``a`` different from 1 change
+    the shape of the basins of the roots.
+
+    Parameters
+    ----------
+    func : ``sympy`` expression
+        The function for which we want to plot fractal (single-
+        variable).
+    a : complex, optional
+        The relaxation factor of the step (default is 1, which
+        is the Newton's method).
+    prec_goal : float, optional
+        Tolerance for how small the iteration step be relative
+        to the point to break the loop for that point.
+    nmax : int, optional
+        Number of iterations to be run (default is 200).
+    backend : {'numpy', 'numexpr'}, optional
+        The module used for evaluating the iteration step (default
+        is 'numpy').
+
+    Attributes
+    ----------
+    function : :obj:`fractpy.Function`
+        The function for which the fractal is being generated.
+    roots_list : list
+        Roots of the function.
+    a : complex
+        The relaxation factor of the step.
+
+    Example
+    -------
+    >>> model = RelaxedNewtonFractal("x**3 - 1", a=1.5 + 0.5j)
+    >>> p = model.plot(-2, 2, -2, 2, (200, 200))
+
+    See Also
+    --------
+    fractpy.models.NewtonFractal :
+        Newton Fractal i.e. the relaxed Newton Fractal with a = 1.
+    """
+
+    _name = "Relaxed Newton Fractal"
+    _parameters = ("a",)
+
+    def __init__(self, func, a=1, prec_goal=1.0e-11, nmax=200, backend="numpy"):
+        self._a = complex(a)
+        super().__init__(func, prec_goal, nmax, backend)
+
+    @property
+    def a(self):
+        return self._a
+
+    def _step_expression(self):
+        """Returns the relaxed Newton step a*f(x)/f'(x)."""
+        import sympy as sym
+
+        return sym.sympify(self.a) * self.function._relative_difference()
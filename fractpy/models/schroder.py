@@ -0,0 +1,45 @@
+"""A class for plotting Schröder Fractal."""
+from fractpy.models.newton import NewtonFractal
+
+
+class SchroderFractal(NewtonFractal):
+    """A class for plotting Schröder Fractal for a given function.
+
+    Schröder's method applies the Newton's method to f(x)/f'(x)
+    instead of f(x), which gives the step
+    f(x)f'(x)/(f'(x)**2 - f(x)f''(x)). Unlike the Newton's method,
+    it converges quadratically to the roots with multiplicity
+    greater than one.
+
+    Parameters
+    ----------
+    func : ``sympy`` expression
+        The function for which we want to plot fractal (single-
+        variable).
+    prec_goal : float, optional
+        Tolerance for how small the iteration step be relative
+        to the point to break the loop for that point.
+    nmax : int, optional
+        Number of iterations to be run (default is 200).
+    backend : {'numpy', 'numexpr'}, optional
+        The module used for evaluating the iteration step (default
+        is 'numpy').
+
+    Attributes
+    ----------
+    function : :obj:`fractpy.Function`
+        The function for which the fractal is being generated.
+    roots_list : list
+        Roots of the function.
+
+    Example
+    -------
+    >>> model = SchroderFractal("(x - 1)**2 (x + 1)")
+    >>> p = model.plot(-2, 2, -2, 2, (200, 200))
+    """
+
+    _name = "Schröder Fractal"
+
+    def _step_expression(self):
+        """Returns the step of Schröder's method."""
+        return self.function._schroder_step()
@@ -0,0 +1,40 @@
+"""Functions for creating the iteration steps of precompiled models
+without importing ``sympy``."""
+import functools
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=128)
+def load_numpy_step(source):
+    """Creates the iteration step from the source of the ``numpy``
+    function generated by ``sympy.lambdify``. The steps are cached,
+    so that a worker receiving the same model many times only
+    compiles it once.
+    """
+    # Names which lambdify adds to the numpy namespace:
+    namespace = dict(vars(np), I=1j, Abs=np.abs, Heaviside=np.heaviside)
+    exec(source, namespace)
+    name = source.split("def ", 1)[1].split("(", 1)[0]
+    return namespace[name]
+
+
+@functools.lru_cache(maxsize=128)
+def load_numexpr_step(variable, terms, result):
+    """Creates the iteration step evaluated with ``numexpr`` from the
+    common subexpressions ``terms`` (pairs of name and ``numexpr``
+    expression) and the ``result`` expression in terms of them.
+    """
+    try:
+        import numexpr
+    except ImportError:
+        raise ImportError("The 'numexpr' backend requires numexpr to be installed")
+
+    def numexpr_step(z):
+        """Evaluates the CSE terms and then the reduced expression with numexpr."""
+        values = {variable: z}
+        for name, expr in terms:
+            values[name] = numexpr.evaluate(expr, local_dict=values)
+        return numexpr.evaluate(result, local_dict=values)
+
+    return numexpr_step
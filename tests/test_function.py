@@ -1,7 +1,9 @@
 """Tests for Function class"""
 
+import importlib.util
 import unittest
 
+import numpy as np
 import sympy as sym
 
 from fractpy import Function
@@ -38,11 +40,24 @@ class TestFunction(unittest.TestCase):
         a = Function(func)
         self.assertEqual(set(a.roots()), set([-1, 1j, -1j]))
 
+    def test_coefficients(self):
+        a = Function("2x**3 - I*x + 1")
+        self.assertEqual(list(a.coefficients()), [2, 0, -1j, 1])
+
+        with self.assertRaises(TypeError):
+            Function("x**2.5 - 1").coefficients()
+
     def test_differentiate(self):
         func = "x**4 - 2*x**2 - 4"
         a = Function(func)
         derivative = 4 * x**3 - 4 * x
         self.assertEqual(a.differentiate(), derivative)
+        self.assertEqual(a.differentiate(2), 12 * x**2 - 4)
+        self.assertEqual(a.differentiate(0), a.function)
+
+        for order in (-1, 1.5):
+            with self.assertRaises(ValueError):
+                a.differentiate(order)
 
     def test_relative_difference(self):
         func = "4*x**2 - x"
@@ -50,6 +65,32 @@ class TestFunction(unittest.TestCase):
         rd = (4 * x**2 - x) / (8 * x - 1)
         self.assertEqual(a._relative_difference(), rd)
 
+    def test_halley_step(self):
+        func = "x**3 - 1"
+        a = Function(func)
+        f, df, d2f = x**3 - 1, 3 * x**2, 6 * x
+        step = 2 * f * df / (2 * df**2 - f * d2f)
+        self.assertEqual(sym.simplify(a._halley_step() - step), 0)
+
+    def test_schroder_step(self):
+        func = "(x - 1)**2"
+        a = Function(func)
+        self.assertEqual(sym.simplify(a._schroder_step() - (x - 1)), 0)
+
+    def test_householder_step(self):
+        a = Function("x**3 - 2x + 1")
+        rd = a._relative_difference()
+        self.assertEqual(sym.simplify(a._householder_step(1) - rd), 0)
+        halley = a._halley_step()
+        self.assertEqual(sym.simplify(a._householder_step(2) - halley), 0)
+
+        for order in (0, 2.5):
+            with self.assertRaises(ValueError):
+                a._householder_step(order)
+
+        # The derivatives of 1/f(x) are cached
+        self.assertIn(2, a._reciprocal_derivatives)
+
     def test_make_python_function(self):
         func = "x**2 + 1"
         a = Function(func)
@@ -70,6 +111,31 @@ class TestFunction(unittest.TestCase):
         self.assertEqual(ans_0, ans_1)
         self.assertEqual(ans_1, ans_2)
 
+    def test_optimize(self):
+        a = Function("sin(x)exp(x)")
+        rd = a._optimize(a._relative_difference(), a.variable)
+        self.assertEqual(rd, sym.sin(x) / (sym.sin(x) + sym.cos(x)))
+
+        a = Function("x**3 - x")
+        rd = a._optimize(a._relative_difference(), a.variable)
+        self.assertEqual(sym.simplify(rd - a._relative_difference()), 0)
+        self.assertEqual(rd, x * (x**2 - 1) / (3 * x**2 - 1))
+
+    def test_make_python_function_backend(self):
+        a = Function("x**2 + 1")
+        with self.assertRaises(ValueError):
+            a._make_python_function(backend="cython")
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("numexpr"), "numexpr is not installed"
+    )
+    def test_numexpr_backend(self):
+        a = Function("sin(x)exp(x) - x**2")
+        z = np.array([0.3 + 0.2j, 1.5 - 1j, -2 + 0.5j])
+        ans_0 = a._rd_python_function()(z)
+        ans_1 = a._rd_python_function(backend="numexpr")(z)
+        self.assertTrue(np.allclose(ans_0, ans_1))
+
     def test_rd_python_function(self):
         func = "x**3 - 2x + 1"
         a = Function(func)
@@ -0,0 +1,67 @@
+"""Tests for the HouseholderFractal and HalleyFractal classes"""
+
+import unittest
+
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+
+from fractpy.models import HouseholderFractal, HalleyFractal, NewtonFractal
+
+
+class TestHouseholderFractal(unittest.TestCase):
+    """Tests for the class Householder Fractal"""
+
+    def test_function_init(self):
+        model = HouseholderFractal("x**3 - 1", order=4)
+        self.assertEqual(model.order, 4)
+        self.assertEqual(len(model.roots_list), 3)
+
+        with self.assertRaises(ValueError):
+            HouseholderFractal("x**3 - 1", order=0)
+
+    def test_function_repr(self):
+        model = HouseholderFractal("x**3 - 1")
+        output = "### FractPy Model ###\nType: Householder Fractal\nFunction: \
+x**3 - 1"
+        self.assertEqual(model.__repr__(), output)
+
+    def test_prepare_plot(self):
+        # First order Householder's method is the Newton's method
+        func = "x**3 - 1"
+        model = NewtonFractal(func)
+        householder = HouseholderFractal(func, order=1)
+        for m in (model, householder):
+            m._width = 10
+            m._height = 10
+        data = model._prepare_plot(-2, 2, -2, 2)
+        self.assertTrue((householder._prepare_plot(-2, 2, -2, 2) == data).all())
+
+    def test_plot(self):
+        model = HouseholderFractal("x**3 - 1", order=3)
+        p = model.plot(-2, 2, -2, 2, (20, 10))
+
+        self.assertIsInstance(p, matplotlib.figure.Figure)
+        self.assertEqual(
+            p.axes[0].title.get_text(),
+            "Householder Fractal for $f(x) = x^{3} - 1$",
+        )
+        plt.close(p)
+
+
+class TestHalleyFractal(unittest.TestCase):
+    """Tests for the class Halley Fractal"""
+
+    def test_function_repr(self):
+        model = HalleyFractal("x**3 - 1")
+        output = "### FractPy Model ###\nType: Halley Fractal\nFunction: \
+x**3 - 1"
+        self.assertEqual(model.__repr__(), output)
+
+    def test_prepare_plot(self):
+        model = HalleyFractal("x**3 - 1")
+        model._width = 10
+        model._height = 10
+        data = model._prepare_plot(-2, 2, -2, 2)
+        self.assertEqual(data.shape, (10, 10))
+        self.assertEqual(set(np.unique(data)), {0, 1, 2})
@@ -1,18 +1,39 @@
 """Tests for the NewtonFractal class"""
 
+import io
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import importlib.util
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
 import numpy as np
 import sympy as sym
 import matplotlib
 import matplotlib.pyplot as plt
 
-from fractpy.models import NewtonFractal
+from fractpy.models import NewtonFractal, RelaxedNewtonFractal, HouseholderFractal
 
 x = sym.Symbol("x")
 i = sym.I
 
 
+class CubicNewtonFractal(NewtonFractal):
+    """A subclass of NewtonFractal outside fractpy.models"""
+
+    _name = "Cubic Newton Fractal"
+
+
+def render(model):
+    model._width = 10
+    model._height = 10
+    return model._prepare_plot(-2, 2, -2, 2)
+
+
 class TestNewtonFractal(unittest.TestCase):
     """Tests for the class Newton Fractal"""
 
@@ -36,6 +57,152 @@ class TestNewtonFractal(unittest.TestCase):
 x**3 - 2*x**2 - 4"
         self.assertEqual(model.__repr__(), output)
 
+    def test_backend(self):
+        model = NewtonFractal("x**2 + 1", backend="numpy")
+        self.assertEqual(model._backend, "numpy")
+        with self.assertRaises(ValueError):
+            NewtonFractal("x**2 + 1", backend="cython")
+
+    def test_to_dict(self):
+        model = NewtonFractal("x**3 - 1", nmax=100)
+        data = model.to_dict()
+        self.assertEqual(data["module"], "fractpy.models.newton")
+        self.assertEqual(data["model"], "NewtonFractal")
+        self.assertEqual(data["function"], "x**3 - 1")
+        self.assertEqual(data["nmax"], 100)
+        self.assertEqual(set(data["roots"]), set(model.roots_list))
+
+        loaded = NewtonFractal.from_dict(data)
+        self.assertEqual(loaded.__repr__(), model.__repr__())
+        self.assertEqual(loaded.function.function, model.function.function)
+        for m in (model, loaded):
+            m._width = 10
+            m._height = 10
+        data = model._prepare_plot(-2, 2, -2, 2)
+        self.assertTrue((loaded._prepare_plot(-2, 2, -2, 2) == data).all())
+
+        # Only subclasses of the class can be loaded
+        with self.assertRaises(TypeError):
+            HouseholderFractal.from_dict(model.to_dict())
+
+    def test_save_load(self):
+        model = HouseholderFractal("x**3 - 1", order=4)
+        file = io.BytesIO()
+        model.save(file)
+        file.seek(0)
+        loaded = NewtonFractal.load(file)
+        self.assertIsInstance(loaded, HouseholderFractal)
+        self.assertEqual(loaded.order, 4)
+        self.assertEqual(loaded._title, model._title)
+
+        z = np.array([0.3 + 0.2j, 1.5 - 1j])
+        self.assertTrue(
+            np.allclose(loaded._iteration_step(z), model._iteration_step(z))
+        )
+
+    def test_to_bytes(self):
+        model = RelaxedNewtonFractal("x**3 - 1", a=0.8 + 0.2j)
+        data = model.to_bytes()
+        self.assertIsInstance(data, bytes)
+
+        loaded = NewtonFractal.from_bytes(data)
+        self.assertIsInstance(loaded, RelaxedNewtonFractal)
+        self.assertEqual(loaded.a, 0.8 + 0.2j)
+        self.assertEqual(list(loaded.to_dict()["coefficients"]), [1, 0, 0, -1])
+        self.assertTrue((render(loaded) == render(model)).all())
+
+        # The iteration step is compiled once per worker
+        again = NewtonFractal.from_bytes(data)
+        self.assertIs(again._iteration_step, loaded._iteration_step)
+
+    def test_pickle(self):
+        model = HouseholderFractal("x**4 - 1", order=2)
+        loaded = pickle.loads(pickle.dumps(model))
+        self.assertIsInstance(loaded, HouseholderFractal)
+        self.assertEqual(loaded.order, 2)
+        self.assertEqual(loaded.__repr__(), model.__repr__())
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(render, [model, model]))
+        for data in results:
+            self.assertTrue((data == render(model)).all())
+
+    def test_save_load_sympy_parameter(self):
+        model = RelaxedNewtonFractal("x**3 - 1", a=1 + i / 2)
+        file = io.BytesIO()
+        model.save(file)
+        file.seek(0)
+        loaded = NewtonFractal.load(file)
+        self.assertEqual(loaded.a, 1 + 0.5j)
+        self.assertTrue((render(loaded) == render(model)).all())
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("numexpr"), "numexpr is not installed"
+    )
+    def test_to_bytes_numexpr(self):
+        model = HouseholderFractal("x**3 - 1", order=3, backend="numexpr")
+        self.assertEqual(model.to_dict()["backend"], "numexpr")
+
+        for loaded in (
+            NewtonFractal.from_bytes(model.to_bytes()),
+            pickle.loads(pickle.dumps(model)),
+        ):
+            self.assertEqual(loaded._backend, "numexpr")
+            self.assertTrue((render(loaded) == render(model)).all())
+
+        file = io.BytesIO()
+        model.save(file)
+        file.seek(0)
+        loaded = NewtonFractal.load(file)
+        self.assertEqual(loaded._backend, "numexpr")
+        self.assertTrue((render(loaded) == render(model)).all())
+
+    def test_from_dict_without_numexpr(self):
+        data = NewtonFractal("x**3 - 1").to_dict()
+        data["backend"] = "numexpr"
+        data["variable"] = "x"
+        data["numexpr_terms"] = []
+        data["numexpr_result"] = "(x**3 - 1)/(3*x**2)"
+        with mock.patch("importlib.util.find_spec", return_value=None):
+            with self.assertWarns(RuntimeWarning):
+                loaded = NewtonFractal.from_dict(data)
+        self.assertEqual(loaded._backend, "numpy")
+        self.assertTrue((render(loaded) == render(NewtonFractal("x**3 - 1"))).all())
+
+    def test_pickle_subclass(self):
+        model = CubicNewtonFractal("x**3 - 1")
+        self.assertEqual(model.to_dict()["module"], __name__)
+        loaded = pickle.loads(pickle.dumps(model))
+        self.assertIsInstance(loaded, CubicNewtonFractal)
+        self.assertEqual(loaded._title, model._title)
+        self.assertTrue((render(loaded) == render(model)).all())
+
+        loaded = NewtonFractal.from_bytes(model.to_bytes())
+        self.assertIsInstance(loaded, CubicNewtonFractal)
+
+        with self.assertRaises(TypeError):
+            HouseholderFractal.from_bytes(model.to_bytes())
+
+    def test_load_without_sympy(self):
+        with tempfile.TemporaryDirectory() as folder:
+            file = os.path.join(folder, "model.npz")
+            NewtonFractal("x**3 - 1").save(file)
+            code = (
+                "import sys\n"
+                "from fractpy.models import NewtonFractal\n"
+                f"model = NewtonFractal.load({file!r})\n"
+                "model._width, model._height = 10, 10\n"
+                "model._prepare_plot(-2, 2, -2, 2)\n"
+                "print('sympy' in sys.modules, 'matplotlib' in sys.modules)\n"
+            )
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                check=True,
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+            ).stdout
+        self.assertEqual(output.strip(), "False False")
+
     def test_make_list(self):
         func = "x**2 + 1"
         model = NewtonFractal(func)
@@ -124,3 +291,39 @@ x**3 - 2*x**2 - 4"
             "Zoom here",
         )
         plt.close(p)
+
+
+class TestRelaxedNewtonFractal(unittest.TestCase):
+    """Tests for the class Relaxed Newton Fractal"""
+
+    def test_function_repr(self):
+        model = RelaxedNewtonFractal("x**2 - 1", a=0.5)
+        output = "### FractPy Model ###\nType: Relaxed Newton Fractal\nFunction: \
+x**2 - 1"
+        self.assertEqual(model.__repr__(), output)
+        self.assertEqual(model.a, 0.5)
+
+    def test_prepare_plot(self):
+        func = "x**3 - 1"
+        model = NewtonFractal(func)
+        relaxed = RelaxedNewtonFractal(func, a=1)
+        for m in (model, relaxed):
+            m._width = 10
+            m._height = 10
+        data = model._prepare_plot(-2, 2, -2, 2)
+        self.assertTrue((relaxed._prepare_plot(-2, 2, -2, 2) == data).all())
+
+        # Damped steps still converge to the roots
+        relaxed = RelaxedNewtonFractal(func, a=0.8 + 0.2j)
+        relaxed._width = 10
+        relaxed._height = 10
+        data = relaxed._prepare_plot(-2, 2, -2, 2)
+        self.assertEqual(set(np.unique(data)), {0, 1, 2})
+
+        # Strongly damped steps converge slowly, but every point
+        # still reaches a root
+        relaxed = RelaxedNewtonFractal(func, a=0.05, nmax=1000)
+        relaxed._width = 40
+        relaxed._height = 40
+        data = relaxed._prepare_plot(-2, 2, -2, 2)
+        self.assertFalse((data == -1).any())
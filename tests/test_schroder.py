@@ -0,0 +1,25 @@
+"""Tests for the SchroderFractal class"""
+
+import unittest
+
+import numpy as np
+
+from fractpy.models import SchroderFractal
+
+
+class TestSchroderFractal(unittest.TestCase):
+    """Tests for the class Schröder Fractal"""
+
+    def test_function_repr(self):
+        model = SchroderFractal("x**2 - 1")
+        output = "### FractPy Model ###\nType: Schröder Fractal\nFunction: \
+x**2 - 1"
+        self.assertEqual(model.__repr__(), output)
+
+    def test_prepare_plot(self):
+        # Converges to the double root as well
+        model = SchroderFractal("(x - 1)**2 (x + 1)")
+        model._width = 10
+        model._height = 10
+        data = model._prepare_plot(-2, 2, -2, 2)
+        self.assertEqual(set(np.unique(data)), {0, 1})